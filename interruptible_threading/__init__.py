@@ -23,8 +23,11 @@ Why not signals: ``signal.pthread_kill`` can unblock a syscall but cannot delive
 exception to a worker thread -- CPython runs Python-level signal handlers only on the
 main thread, and PEP 475's EINTR auto-retry loops call ``PyErr_CheckSignals()``
 (a no-op off the main thread) without consulting ``tstate->async_exc``, so the
-syscall is transparently retried. The self-pipe + cooperative-primitive approach is
-the only way to get prompt, exception-bearing interruption of worker threads.
+syscall is transparently retried. The wakeup-fd + cooperative-primitive approach is
+the only way to get prompt, exception-bearing interruption of worker threads. A
+signal nudge is still available as an opt-in (``install_patches(nudge_signal=...)``)
+for C code that surfaces EINTR to Python instead of retrying (e.g. ``ctypes`` calls),
+letting the armed async exception fire once control returns to the interpreter.
 """
 from __future__ import annotations
 
@@ -33,10 +36,13 @@ import ctypes
 import os
 import select
 import selectors
+import signal
 import socket as _socket
 import sys
 import threading
 import time
+import weakref
+from collections import deque
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -77,10 +83,13 @@ class _ThreadInterruptedKeyboard(ThreadInterrupted, KeyboardInterrupt):
 # The exception class delivered by interrupt(); swapped by install_patches().
 _INTERRUPT_EXC: type[BaseException] = ThreadInterrupted
 
+# Signal sent alongside async injection to break a C call out of its syscall with
+# EINTR (opt-in via install_patches(nudge_signal=...)); None when disabled.
+_NUDGE_SIGNAL: int | None = None
+
 _PTSSE = ctypes.pythonapi.PyThreadState_SetAsyncExc
 _PTSSE.argtypes = [ctypes.c_ulong, ctypes.py_object]
 _PTSSE.restype = ctypes.c_int
-_MAIN_IDENT = threading.main_thread().ident
 
 _ORIG_SLEEP = time.sleep
 _ORIG_DEFAULT_SELECTOR = selectors.DefaultSelector
@@ -88,7 +97,17 @@ _ORIG_SELECT = select.select
 _ORIG_THREAD = threading.Thread
 _ORIG_COND_WAIT = threading.Condition.wait
 
-_WAKEUP_TOKEN = "__interruptible_wakeup__"
+# Selector key data marking the wakeup fd; compared by identity, and unlike a
+# string it cannot collide with data a caller registers.
+_WAKEUP_TOKEN = object()
+
+# Linux (3.10+): a single eventfd replaces the two-fd self-pipe. Its kernel-side
+# counter is cleared by one 8-byte read, so no drain loop is needed.
+_USE_EVENTFD = hasattr(os, "eventfd")
+
+# Sleeps at or below this (seconds) bypass the Condition park: they are used as
+# yields, and interrupt latency at that scale is irrelevant.
+_SHORT_SLEEP = 0.001
 
 # Max latency (seconds) for chunked-poll primitives (Condition.wait / Event / Queue).
 _POLL_INTERVAL = 0.05
@@ -115,6 +134,10 @@ def _clear_async_exc(tid: int | None = None) -> None:
     )
 
 
+def _noop_signal_handler(signum, frame) -> None:
+    """Handler for the nudge signal: its only job is to make the syscall EINTR."""
+
+
 def _tracing_active() -> bool:
     """Whether a trace/profile hook is installed (coverage, a debugger, a
     profiler) anywhere we can observe.
@@ -136,7 +159,13 @@ def _tracing_active() -> bool:
 
 
 def _drain(fd: int) -> None:
-    """Drain a non-blocking wakeup pipe until empty."""
+    """Drain a non-blocking wakeup fd (eventfd or self-pipe) until empty."""
+    if _USE_EVENTFD:
+        try:
+            os.eventfd_read(fd)
+        except (BlockingIOError, OSError):
+            pass
+        return
     while True:
         try:
             if not os.read(fd, 65536):
@@ -145,9 +174,19 @@ def _drain(fd: int) -> None:
             break
 
 
+# Guards writes to _State.registry and descendants_of()'s snapshot of the thread
+# tree. A plain module global so the thread start/exit path acquires it without a
+# class-attribute lookup. (_State.children sets are mutated without it: set.add /
+# set.discard are atomic under the GIL, and the snapshot copies them in C.)
+_registry_lock = threading.RLock()
+
+
 class _State:
-    registry_lock = threading.RLock()
-    registry: dict[int, _State] = {}
+    # Weak values: the owning InterruptibleThread holds the strong reference
+    # (``_state``, while registered), so an entry whose explicit unregistration
+    # was missed cannot outlive its thread object. Explicit unregistration is
+    # still required for prompt cleanup and because thread idents are reused.
+    registry: weakref.WeakValueDictionary[int, _State] = weakref.WeakValueDictionary()
 
     def __init__(self) -> None:
         cur_thread = threading.current_thread()
@@ -175,14 +214,24 @@ class _State:
         # asyncio integration (set by run_interruptible).
         self.event_loop: Any = None
         self.root_task: Any = None
-        # Lazily-allocated self-pipe; only needed on the selector/select path.
+        # Lazily-allocated wakeup fd(s); only needed on the selector/select path.
+        # With an eventfd, rfd == wfd.
         self.rfd = -1
         self.wfd = -1
+        # A wakeup has been written and not yet drained; further nudges are
+        # redundant until it is. Both sides run under cancel_cond.
+        self.wakeup_pending = False
 
     def ensure_pipe(self) -> None:
-        """Allocate the self-pipe on first use (idempotent)."""
+        """Allocate the wakeup eventfd / self-pipe on first use (idempotent)."""
         with self.cancel_cond:
             if self.rfd == -1:
+                if _USE_EVENTFD:
+                    # Non-blocking for the same reason as the pipe's write end below.
+                    self.rfd = self.wfd = os.eventfd(
+                        0, os.EFD_NONBLOCK | os.EFD_CLOEXEC
+                    )
+                    return
                 r, w = os.pipe()
                 os.set_blocking(r, False)
                 # The write end must also be non-blocking: ``_pipe_write`` runs
@@ -195,32 +244,105 @@ class _State:
     @classmethod
     def register_current_thread(cls) -> _State:
         tid = threading.get_ident()
-        with cls.registry_lock:
-            st = cls.registry.get(tid)
-            if st is None:
-                st = cls()
-                cls.registry[tid] = st
+        st = cls.registry.get(tid)
+        if st is not None:
             return st
+        # Build the state outside the lock so a burst of thread starts serializes
+        # only on the registry insert, not on Condition / lock allocation.
+        st = cls()
+        with _registry_lock:
+            return cls.registry.setdefault(tid, st)
 
     @classmethod
-    def get_state_by_ident(cls, tid: int | None = None) -> _State | None:
-        return cls.registry.get(tid if tid is not None else threading.get_ident())
+    def descendants_of(cls, st: _State) -> list[tuple[int, _State]]:
+        """Snapshot ``st``'s live descendants, breadth-first, under one hold of the
+        registry lock. Iterative, so deep thread trees cannot exhaust the stack."""
+        out: list[tuple[int, _State]] = []
+        with _registry_lock:
+            seen = {st.thread.ident}
+            pending = deque(st.children)
+            while pending:
+                tid = pending.popleft()
+                if tid in seen:
+                    continue
+                seen.add(tid)
+                child_st = cls.registry.get(tid)
+                if child_st is None:
+                    continue
+                out.append((tid, child_st))
+                pending.extend(child_st.children)
+        return out
 
     @classmethod
     def unregister_current_thread(cls) -> None:
         tid = threading.get_ident()
-        with cls.registry_lock:
+        with _registry_lock:
             st = cls.registry.pop(tid, None)
             if not st:
                 return
-            for fd in (st.rfd, st.wfd):
-                if fd == -1:
-                    continue
-                try:
-                    os.close(fd)
-                except OSError:
-                    pass
-            st.rfd = st.wfd = -1
+            st.close_fds()
+
+    def close_fds(self) -> None:
+        """Close the wakeup fd(s), if allocated (idempotent)."""
+        for fd in {self.rfd, self.wfd}:
+            if fd == -1:
+                continue
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self.rfd = self.wfd = -1
+
+    def __del__(self) -> None:
+        # Backstop for a missed unregister_current_thread(): never leak the fds.
+        # (Skipped if __init__ raised before they were initialized.)
+        if hasattr(self, "rfd"):
+            self.close_fds()
+
+
+class _ThreadLocalState(threading.local):
+    """Per-thread pointer to the current thread's registered ``_State``.
+
+    Only ``InterruptibleThread.run()`` registers a thread, and it sets ``state``
+    itself; every other thread (main included) sees the class-level ``None``
+    default. The patched primitives therefore decide whether to bypass to the
+    originals with one attribute read -- no ``get_ident()``, no registry lookup.
+    """
+
+    state: _State | None = None
+
+
+_tls = _ThreadLocalState()
+
+
+def _begin_select(st: _State) -> None:
+    """Pre-park check for the select-style paths: raise if an unmasked interrupt
+    is pending, else set the ``selecting`` hint."""
+    with st.cancel_cond:
+        if _take_pending(st):
+            raise _INTERRUPT_EXC()
+        st.selecting = True
+
+
+def _abort_select(st: _State) -> None:
+    """Clear the ``selecting`` hint after the underlying select raised."""
+    with st.cancel_cond:
+        st.selecting = False
+
+
+def _finish_select(st: _State, woke: bool) -> None:
+    """Post-wake bookkeeping for the select-style paths, in one critical section:
+    clear the ``selecting`` hint, drain the wakeup fd if it fired, and raise if an
+    unmasked interrupt is pending. The nudge in ``interrupt()`` writes under the
+    same lock, so draining here cannot swallow a wakeup meant for a later park.
+    """
+    with st.cancel_cond:
+        st.selecting = False
+        if woke:
+            _drain(st.rfd)
+            st.wakeup_pending = False
+        if _take_pending(st):
+            raise _INTERRUPT_EXC()
 
 
 def _disarm_async(st: _State) -> None:
@@ -249,6 +371,20 @@ def _take_pending(st: _State) -> bool:
     return False
 
 
+def _check_pending(st: _State) -> None:
+    """Raise if an unmasked interrupt is pending for ``st`` (the current thread).
+
+    Double-checked: the flag is peeked without the lock (a plain attribute read is
+    atomic under the GIL), and the lock is taken only to consume it, so the common
+    nothing-pending case costs no acquire. A flag set just after the peek is seen by
+    the next check, exactly as if it had arrived just after a locked check.
+    """
+    if st.pending:
+        with st.cancel_cond:
+            if _take_pending(st):
+                raise _INTERRUPT_EXC()
+
+
 # --------------------------------------------------------------------------- #
 # Public cooperative API (operates on the *current* thread)                    #
 # --------------------------------------------------------------------------- #
@@ -259,8 +395,7 @@ def is_interrupted(thread: InterruptibleThread | None = None) -> bool:
 
     Non-consuming; safe to call after the thread has exited (returns ``False``).
     """
-    tid = thread.ident if thread is not None else threading.get_ident()
-    st = _State.get_state_by_ident(tid)
+    st = getattr(thread, "_state", None) if thread is not None else _tls.state
     if st is None:
         return False
     with st.cancel_cond:
@@ -277,7 +412,7 @@ def clear_interrupt() -> bool:
     thread parks in a blocking call before async injection can fire), so without
     clearing it the next checkpoint or blocking primitive would re-raise.
     """
-    st = _State.get_state_by_ident()
+    st = _tls.state
     if st is None:
         return False
     with st.cancel_cond:
@@ -294,12 +429,9 @@ def check_interrupt() -> None:
     Cheap; intended for CPU-bound loops and around opaque C calls so they become
     interruptible while still honoring ``critical_section()``.
     """
-    st = _State.get_state_by_ident()
-    if st is None:
-        return
-    with st.cancel_cond:
-        if _take_pending(st):
-            raise _INTERRUPT_EXC()
+    st = _tls.state
+    if st is not None:
+        _check_pending(st)
 
 
 # Alias.
@@ -346,7 +478,7 @@ def interrupts_disabled() -> Iterator[None]:
     (sleep / select / Condition / checkpoints); an async exception already in flight
     from ``SetAsyncExc`` microseconds before entering cannot be recalled.
     """
-    st = _State.get_state_by_ident()
+    st = _tls.state
     if st is None:
         yield
         return
@@ -376,12 +508,14 @@ critical_section = interrupts_disabled
 
 
 def _coop_sleep(secs: float) -> None:
-    tid = threading.get_ident()
-    if tid == _MAIN_IDENT:
-        return _ORIG_SLEEP(secs)
-    st = _State.get_state_by_ident(tid)
+    st = _tls.state
     if st is None:
         return _ORIG_SLEEP(secs)
+    if secs <= _SHORT_SLEEP:
+        # A polling loop of short sleeps still observes interrupts, without paying
+        # a lock per yield.
+        _check_pending(st)
+        return _ORIG_SLEEP(secs)
     deadline = time.monotonic() + secs
     with st.cancel_cond:
         while True:
@@ -400,17 +534,12 @@ def _coop_sleep(secs: float) -> None:
 
 
 def _patched_cond_wait(self: threading.Condition, timeout: float | None = None) -> bool:
-    tid = threading.get_ident()
-    if tid == _MAIN_IDENT:
-        return _ORIG_COND_WAIT(self, timeout)
-    st = _State.get_state_by_ident(tid)
+    st = _tls.state
     if st is None:
         return _ORIG_COND_WAIT(self, timeout)
     deadline = None if timeout is None else time.monotonic() + timeout
     while True:
-        with st.cancel_cond:
-            if _take_pending(st):
-                raise _INTERRUPT_EXC()
+        _check_pending(st)
         if deadline is None:
             chunk = _POLL_INTERVAL
         else:
@@ -424,50 +553,85 @@ def _patched_cond_wait(self: threading.Condition, timeout: float | None = None)
 
 
 class _InterruptibleSelector(_ORIG_DEFAULT_SELECTOR):
-    """DefaultSelector that also watches the current thread's self-pipe, so an
-    interrupt can wake a parked ``select`` (this is what makes asyncio interruptible).
+    """DefaultSelector that also watches the current thread's wakeup fd (eventfd on
+    Linux, self-pipe elsewhere), so an interrupt can wake a parked ``select`` (this is
+    what makes asyncio interruptible).
     """
 
     def __init__(self) -> None:
         super().__init__()
-        st = self._ithr_st = _State.get_state_by_ident()
-        if st is not None:
-            st.ensure_pipe()
-            try:
-                super().register(st.rfd, selectors.EVENT_READ, data=_WAKEUP_TOKEN)
-            except (KeyError, ValueError):
-                pass
+        self._ithr_st = _tls.state
+        # The wakeup fd is registered on first select(), so selectors that are
+        # built and closed without ever parking skip the fd allocation and the
+        # kernel registration (epoll_ctl / kevent) entirely.
+        self._ithr_wakeup_registered = False
+
+    def _register_wakeup(self, st: _State) -> None:
+        st.ensure_pipe()
+        try:
+            super().register(st.rfd, selectors.EVENT_READ, data=_WAKEUP_TOKEN)
+        except (KeyError, ValueError):
+            pass
+        self._ithr_wakeup_registered = True
 
     def select(self, timeout: float | None = None):
-        st = getattr(self, "_ithr_st", None)
+        st = self._ithr_st
         if st is None:
             return super().select(timeout)
-        with st.cancel_cond:
-            if _take_pending(st):
-                raise _INTERRUPT_EXC()
-            st.selecting = True
+        if not self._ithr_wakeup_registered:
+            self._register_wakeup(st)
+        _begin_select(st)
         try:
             events = super().select(timeout)
-        finally:
-            with st.cancel_cond:
-                st.selecting = False
-        out = []
-        for key, mask in events:
-            if key.data == _WAKEUP_TOKEN:
-                _drain(key.fd)
-                continue
-            out.append((key, mask))
-        with st.cancel_cond:
-            if _take_pending(st):
-                raise _INTERRUPT_EXC()
-        return out
+        except BaseException:
+            _abort_select(st)
+            raise
+        woke = any(key.data is _WAKEUP_TOKEN for key, _mask in events)
+        if woke:
+            events = [ev for ev in events if ev[0].data is not _WAKEUP_TOKEN]
+        _finish_select(st, woke)
+        return events
 
 
 def _fileno(x: IOBase | int) -> int:
-    try:
-        return x.fileno()  # type: ignore[union-attr]
-    except AttributeError:
-        return int(x)  # type: ignore[arg-type]
+    # Type checks rather than try/except: no exception setup per element, and no
+    # AttributeError is created on the common raw-fd path.
+    if type(x) is int:
+        return x
+    if isinstance(x, int):
+        return int(x)
+    fileno = getattr(x, "fileno", None)
+    if fileno is None:
+        # Same error the stdlib raises, so callers catching TypeError still work.
+        raise TypeError("argument must be an int, or have a fileno() method.")
+    return fileno()
+
+
+def _fd_map(objs: list[IOBase | int]) -> tuple[dict[int, IOBase | int], bool]:
+    """Map each fd to the caller's object for it, and report whether any fd has
+    more than one owner (the same object listed twice, or a socket alongside its
+    own ``fileno()``) -- see ``_map_ready``."""
+    fmap: dict[int, IOBase | int] = {}
+    for o in objs:
+        fmap.setdefault(_fileno(o), o)
+    return fmap, len(fmap) < len(objs)
+
+
+def _map_ready(
+    ready: list[int],
+    objs: list[IOBase | int],
+    fmap: dict[int, IOBase | int],
+    aliased: bool,
+) -> list[IOBase | int]:
+    """Map select's ready fds back to the caller's objects, as the stdlib does:
+    every matching input entry, in input order. Without aliasing that is just the
+    (typically short) ready list mapped through ``fmap``; only when fds are
+    aliased are the inputs rescanned. fds absent from ``fmap`` (the wakeup fd)
+    are dropped."""
+    if aliased:
+        hit = set(ready)
+        return [o for o in objs if _fileno(o) in hit]
+    return [fmap[fd] for fd in ready if fd in fmap]
 
 
 def _patched_select(
@@ -476,92 +640,87 @@ def _patched_select(
     xlist: list[IOBase | int],
     timeout: float | None = None,
 ) -> tuple[list[IOBase | int], list[IOBase | int], list[IOBase | int]]:
-    tid = threading.get_ident()
-    if tid == _MAIN_IDENT:
-        return _ORIG_SELECT(rlist, wlist, xlist, timeout)
-    st = _State.get_state_by_ident(tid)
+    st = _tls.state
     if st is None:
         return _ORIG_SELECT(rlist, wlist, xlist, timeout)
 
     st.ensure_pipe()
+    if not wlist and not xlist:
+        return _select_reads(st, rlist, timeout)
     rfd = st.rfd
 
-    def to_fd_list(lst: list[IOBase | int]) -> list[tuple[int, IOBase | int]]:
-        return [(_fileno(o), o) for o in lst]
-
-    rmap = to_fd_list(rlist)
-    wmap = to_fd_list(wlist)
-    xmap = to_fd_list(xlist)
-
-    rfd_list = [fd for fd, _ in rmap]
-    wfd_list = [fd for fd, _ in wmap]
-    xfd_list = [fd for fd, _ in xmap]
+    rmap, r_aliased = _fd_map(rlist)
+    wmap, w_aliased = _fd_map(wlist)
+    xmap, x_aliased = _fd_map(xlist)
 
-    if rfd not in rfd_list:
+    rfd_list = list(rmap)
+    if rfd not in rmap:
         rfd_list.append(rfd)
 
-    with st.cancel_cond:
-        if _take_pending(st):
-            raise _INTERRUPT_EXC()
-        st.selecting = True
+    _begin_select(st)
     try:
-        rr, ww, xx = _ORIG_SELECT(rfd_list, wfd_list, xfd_list, timeout)
-    finally:
-        with st.cancel_cond:
-            st.selecting = False
-
-    if rfd in rr:
-        _drain(rfd)
-    with st.cancel_cond:
-        if _take_pending(st):
-            raise _INTERRUPT_EXC()
-
-    def map_back(
-        fd_list: list[int], fmap: list[tuple[int, IOBase | int]]
-    ) -> list[IOBase | int]:
-        fds = set(fd_list)
-        return [obj for fd, obj in fmap if fd in fds]
+        rr, ww, xx = _ORIG_SELECT(rfd_list, list(wmap), list(xmap), timeout)
+    except BaseException:
+        _abort_select(st)
+        raise
+    _finish_select(st, rfd in rr)
 
     return (
-        map_back(rr, rmap),
-        map_back(ww, wmap),
-        map_back(xx, xmap),
+        _map_ready(rr, rlist, rmap, r_aliased),
+        _map_ready(ww, wlist, wmap, w_aliased),
+        _map_ready(xx, xlist, xmap, x_aliased),
     )
 
 
+def _select_reads(
+    st: _State, rlist: list[IOBase | int], timeout: float | None
+) -> tuple[list[IOBase | int], list[IOBase | int], list[IOBase | int]]:
+    """``_patched_select`` specialized for the dominant read-only call (empty
+    ``wlist`` / ``xlist``): one map, one fd list."""
+    rfd = st.rfd
+    rmap, aliased = _fd_map(rlist)
+    rfd_list = list(rmap)
+    if rfd not in rmap:
+        rfd_list.append(rfd)
+    _begin_select(st)
+    try:
+        rr, _ww, _xx = _ORIG_SELECT(rfd_list, (), (), timeout)
+    except BaseException:
+        _abort_select(st)
+        raise
+    _finish_select(st, rfd in rr)
+    return _map_ready(rr, rlist, rmap, aliased), [], []
+
+
 # --------------------------------------------------------------------------- #
-# Interruptible socket helpers (opt-in; reuse the self-pipe directly)          #
+# Interruptible socket helpers (opt-in; reuse the wakeup fd directly: eventfd #
+# on Linux, self-pipe elsewhere)                                              #
 # --------------------------------------------------------------------------- #
 
 
 def _interruptible_io(sock: _socket.socket, want_write: bool, op):
-    tid = threading.get_ident()
-    st = _State.get_state_by_ident(tid)
-    if st is None or tid == _MAIN_IDENT:
+    st = _tls.state
+    if st is None:
         return op()
     st.ensure_pipe()
     prev_timeout = sock.gettimeout()
     sock.setblocking(False)
     try:
         while True:
-            with st.cancel_cond:
-                if _take_pending(st):
-                    raise _INTERRUPT_EXC()
-                st.selecting = True
+            _begin_select(st)
             try:
                 if want_write:
-                    _rr, ww, _xx = _ORIG_SELECT([st.rfd], [sock], [])
+                    wake_r, ww, _xx = _ORIG_SELECT([st.rfd], [sock], [])
                     ready = sock in ww
+                    woke = st.rfd in wake_r
                 else:
                     rr, _ww, _xx = _ORIG_SELECT([sock, st.rfd], [], [])
                     ready = sock in rr
-            finally:
-                with st.cancel_cond:
-                    st.selecting = False
-            _drain(st.rfd)
-            with st.cancel_cond:
-                if _take_pending(st):
-                    raise _INTERRUPT_EXC()
+                    woke = st.rfd in rr
+            except BaseException:
+                _abort_select(st)
+                raise
+            _finish_select(st, woke)
             if ready:
                 try:
                     return op()
@@ -613,29 +772,34 @@ class InterruptibleThread(_ORIG_THREAD):
 
     _patches_installed = False
     _socket_patched = False
+    _prev_nudge_handler: Any = None
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self._parent_tid = threading.get_ident()
+        # State of the constructing thread (None unless it is interruptible),
+        # captured here so run() links to it without a registry lookup.
+        self._parent_state: _State | None = _tls.state
+        # This thread's state while registered: the strong reference keeping the
+        # weak registry entry alive, and interrupt()'s lookup-free handle. Cleared
+        # under its cancel_cond at unregistration.
+        self._state: _State | None = None
 
     def run(self) -> None:
-        with _State.registry_lock:
-            _State.register_current_thread()
-            parent_st = _State.get_state_by_ident(self._parent_tid)
-            if parent_st is not None:
-                parent_st.children.add(threading.get_ident())
+        my_tid = threading.get_ident()
+        st = _tls.state = self._state = _State.register_current_thread()
+        parent_st = self._parent_state
+        if parent_st is not None:
+            parent_st.children.add(my_tid)
         try:
             super().run()
         finally:
-            my_tid = threading.get_ident()
-            with _State.registry_lock:
-                parent_st = _State.get_state_by_ident(self._parent_tid)
-                if parent_st is not None:
-                    parent_st.children.discard(my_tid)
-                st = _State.get_state_by_ident(my_tid)
-            if st is not None:
-                with st.cancel_cond:
-                    _State.unregister_current_thread()
+            if parent_st is not None:
+                parent_st.children.discard(my_tid)
+            with st.cancel_cond:
+                _State.unregister_current_thread()
+                self._state = None
+            _tls.state = None
+            self._parent_state = None
 
     @classmethod
     def run_interruptible(cls, coro):
@@ -645,7 +809,7 @@ class InterruptibleThread(_ORIG_THREAD):
         result; re-raises the interrupt exception if interrupted."""
         import asyncio
 
-        st = _State.get_state_by_ident()
+        st = _tls.state
 
         async def _runner():
             if st is not None:
@@ -678,13 +842,32 @@ class InterruptibleThread(_ORIG_THREAD):
             _PTSSE(tid, ctypes.py_object())
             raise SystemError("SetAsyncExc affected multiple threads")
 
+    def _signal_nudge(self, signum: int) -> None:
+        """Interrupt the target's current syscall (EINTR) so a C call that does not
+        auto-retry returns to the interpreter, where the armed async exception
+        fires. Must be called holding the target's ``cancel_cond`` while it is
+        still registered, which guarantees the pthread has not exited."""
+        try:
+            signal.pthread_kill(self.ident or 0, signum)
+        except OSError:
+            pass
+
     @staticmethod
     def _pipe_write(st: _State) -> None:
-        if st.wfd != -1:
+        """Must be called holding ``st.cancel_cond``."""
+        if st.wfd != -1 and not st.wakeup_pending:
             try:
-                os.write(st.wfd, b"\x00")
+                if _USE_EVENTFD:
+                    os.eventfd_write(st.wfd, 1)
+                else:
+                    os.write(st.wfd, b"\x00")
+            except BlockingIOError:
+                # Full pipe: a wakeup is already queued.
+                st.wakeup_pending = True
             except OSError:
                 pass
+            else:
+                st.wakeup_pending = True
 
     def _nudge(self, st: _State) -> None:
         """Wake the target out of any current park without arming an async exception.
@@ -706,37 +889,67 @@ class InterruptibleThread(_ORIG_THREAD):
             self._inject_exc()
 
     def interrupt(self, recursive: bool = False) -> None:
-        st = _State.get_state_by_ident(self.ident)
+        st = self._state
         if st is None:
             raise ValueError("no such thread")
 
-        if recursive:
-            with _State.registry_lock:
-                children = list(st.children)
-            for child_tid in children:
-                with _State.registry_lock:
-                    child_st = _State.get_state_by_ident(child_tid)
-                    child_thread = child_st.thread if child_st is not None else None
-                if (
-                    child_thread is None
-                    or child_thread.ident != child_tid
-                    or not child_thread.is_alive()
-                ):
-                    continue
-                try:
-                    child_thread.interrupt(recursive=True)
-                except ValueError:
-                    continue
+        if not recursive:
+            self._deliver(st)
+            return
+
+        # Two passes over the snapshot (this thread included): first every
+        # cooperative wakeup (notify / wakeup-fd write), then the comparatively slow
+        # async injections, so a wide tree's parked threads are not woken behind
+        # SetAsyncExc calls.
+        owed: list[tuple[InterruptibleThread, _State]] = []
+        if self._deliver(st, inject=False):
+            owed.append((self, st))
+        for child_tid, child_st in _State.descendants_of(st):
+            child_thread = child_st.thread
+            if child_thread.ident != child_tid or not child_thread.is_alive():
+                continue
+            try:
+                if child_thread._deliver(child_st, inject=False):
+                    owed.append((child_thread, child_st))
+            except ValueError:
+                continue
+        for thread, owed_st in owed:
+            try:
+                thread._inject_owed(owed_st)
+            except ValueError:
+                continue
 
+    def _arm_async(self, st: _State) -> None:
+        """Async-inject the interrupt. Must be called holding ``st.cancel_cond``."""
+        self._inject_exc()
+        st.async_armed = True
+        if _NUDGE_SIGNAL is not None:
+            self._signal_nudge(_NUDGE_SIGNAL)
+
+    def _inject_owed(self, st: _State) -> None:
+        """Second pass of a recursive interrupt: async-inject if ``_deliver(st,
+        inject=False)`` deferred it and the interrupt is still undelivered (the
+        thread may have consumed it cooperatively, or masked, in the meantime)."""
         with st.cancel_cond:
-            if _State.get_state_by_ident(self.ident) is None:
-                # Thread terminated while we waited on the lock; nothing to do.
+            if self._state is not st:
                 return
+            if st.pending and not st.async_armed and st.mask_depth == 0:
+                self._arm_async(st)
+
+    def _deliver(self, st: _State, inject: bool = True) -> bool:
+        """Request an interrupt of this thread (whose state is ``st``), without
+        touching its children. With ``inject=False``, an async injection that would
+        be issued is left to the caller (via ``_inject_owed``); returns whether one
+        is owed."""
+        with st.cancel_cond:
+            if self._state is not st:
+                # Thread terminated while we waited on the lock; nothing to do.
+                return False
             if st.pending:
                 # Already requested -- idempotent. Re-nudge in case a prior wakeup
                 # was missed; never re-arm async injection.
                 self._nudge(st)
-                return
+                return False
             st.pending = True
             st.interrupt_gen += 1
 
@@ -775,15 +988,17 @@ class InterruptibleThread(_ORIG_THREAD):
                 # only a checkpoint-less pure-Python loop is left uninterruptible
                 # while tracing (a narrow, documented gap).
                 if not _tracing_active():
-                    self._inject_exc()
-                    st.async_armed = True
+                    if not inject:
+                        return True
+                    self._arm_async(st)
+        return False
 
     @classmethod
     def get_thread_cls_for_current_thread(cls, item: str) -> type[threading.Thread]:
         if item != "Thread":
             raise AttributeError("No attribute %s in module threading" % item)
-        st = _State.get_state_by_ident()
-        if st is None:
+        # _tls.state is set and cleared by run(), so this tracks thread start/exit.
+        if _tls.state is None:
             return _ORIG_THREAD
         else:
             return cls
@@ -794,6 +1009,7 @@ class InterruptibleThread(_ORIG_THREAD):
         interrupt_exc: type[BaseException] = ThreadInterrupted,
         legacy_keyboardinterrupt: bool = False,
         monkeypatch_socket: bool = False,
+        nudge_signal: int | None = None,
     ) -> None:
         """Install the stdlib monkeypatches that make blocking calls interruptible.
 
@@ -803,10 +1019,18 @@ class InterruptibleThread(_ORIG_THREAD):
         ``ThreadInterrupted`` and ``KeyboardInterrupt`` handlers.
         ``monkeypatch_socket``: also swap blocking ``socket.recv/send/accept`` for
         their interruptible variants process-wide (off by default; large blast radius).
+        ``nudge_signal``: a signal number (e.g. ``signal.SIGUSR1``) to also send the
+        target with ``pthread_kill`` when async-injecting, so C calls that return
+        EINTR to Python instead of retrying are broken out (off by default). A no-op
+        handler is installed for it, so this must be called from the main thread.
         """
-        global _INTERRUPT_EXC
+        global _INTERRUPT_EXC, _NUDGE_SIGNAL
         if cls._patches_installed:
             raise ValueError("patches already installed")
+        if nudge_signal is not None:
+            # First, so a non-main-thread ValueError leaves nothing half-patched.
+            cls._prev_nudge_handler = signal.signal(nudge_signal, _noop_signal_handler)
+            _NUDGE_SIGNAL = nudge_signal
         cls._patches_installed = True
 
         if legacy_keyboardinterrupt:
@@ -835,9 +1059,16 @@ class InterruptibleThread(_ORIG_THREAD):
 
     @classmethod
     def uninstall_patches(cls) -> None:
-        global _INTERRUPT_EXC
+        global _INTERRUPT_EXC, _NUDGE_SIGNAL
         if not cls._patches_installed:
             raise ValueError("patches not installed")
+        if _NUDGE_SIGNAL is not None:
+            # First, so a non-main-thread ValueError leaves everything installed.
+            # None means the prior handler was not installed from Python.
+            prev = cls._prev_nudge_handler
+            signal.signal(_NUDGE_SIGNAL, signal.SIG_DFL if prev is None else prev)
+            cls._prev_nudge_handler = None
+            _NUDGE_SIGNAL = None
         cls._patches_installed = False
         time.sleep = _ORIG_SLEEP
         select.select = _ORIG_SELECT  # type: ignore
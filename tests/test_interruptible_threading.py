@@ -89,8 +89,8 @@ class Result:
         self.done = threading.Event()
 
 
-def run_worker(fn, *, daemon=True) -> tuple[InterruptibleThread, Result]:
-    res = Result()
+def capturing(fn, res: Result):
+    """Wrap ``fn(res)`` as a thread target that records its outcome in ``res``."""
 
     def target():
         res.started.set()
@@ -101,7 +101,12 @@ def run_worker(fn, *, daemon=True) -> tuple[InterruptibleThread, Result]:
         finally:
             res.done.set()
 
-    t = InterruptibleThread(target=target, daemon=daemon)
+    return target
+
+
+def run_worker(fn, *, daemon=True) -> tuple[InterruptibleThread, Result]:
+    res = Result()
+    t = InterruptibleThread(target=capturing(fn, res), daemon=daemon)
     t.start()
     res.started.wait(5)
     return t, res
@@ -227,6 +232,24 @@ def test_interrupt_sleeping_thread_under_tracing_no_deadlock(patched):
             assert not t.is_alive()
 
 
+def test_short_sleep_polling_loop_interrupted_under_tracing(patched):
+    # Short sleeps skip the Condition park; under tracing (no async injection) the
+    # durable flag must still be observed on the fast path.
+    with _global_tracing():
+
+        def fn(res):
+            while True:
+                time.sleep(0)
+                time.sleep(0.0005)
+
+        t, res = run_worker(fn)
+        _REAL_SLEEP(0.05)
+        t.interrupt()
+        assert res.done.wait(3)
+        assert isinstance(res.exc, ThreadInterrupted)
+        t.join(2)
+
+
 def test_select_interrupted(patched):
     import select
 
@@ -246,6 +269,165 @@ def test_select_interrupted(patched):
         os.close(w)
 
 
+def test_select_returns_callers_objects(patched):
+    import select
+
+    a, b = socket.socketpair()
+    r, w = os.pipe()
+    try:
+        b.send(b"x")
+
+        def fn(res):
+            # General path, then the read-only fast path.
+            return select.select([r, a], [b], [], 1), select.select([r, a], [], [], 1)
+
+        t, res = run_worker(fn)
+        assert res.done.wait(2)
+        t.join(2)
+        general, reads_only = res.value
+        assert general == ([a], [b], [])
+        assert reads_only == ([a], [], [])
+    finally:
+        a.close()
+        b.close()
+        os.close(r)
+        os.close(w)
+
+
+class _Fd:
+    """Distinct file-like wrapper around a shared fd."""
+
+    def __init__(self, fd: int) -> None:
+        self._fd = fd
+
+    def fileno(self) -> int:
+        return self._fd
+
+
+def test_select_returns_duplicate_and_aliased_entries(patched):
+    import select
+
+    a, b = socket.socketpair()
+    try:
+        b.send(b"x")
+        f1, f2 = _Fd(a.fileno()), _Fd(a.fileno())
+        rlist = [f1, f2, a, a.fileno(), a]
+        wlist = [b, _Fd(b.fileno()), b]
+        # Aliases of one fd interleaved with another fd must keep input order.
+        mixed = [_Fd(a.fileno()), b, a]
+
+        def fn(res):
+            # General path, then the read-only fast path.
+            return (
+                select.select(rlist, wlist, [], 1),
+                select.select(rlist, [], [], 1),
+                select.select([], mixed, [], 1),
+                select.select(mixed, [], [], 1),
+            )
+
+        t, res = run_worker(fn)
+        assert res.done.wait(2)
+        t.join(2)
+        general, reads_only, w_mixed, r_mixed = res.value
+        # Every caller object sharing a ready fd comes back, as with the stdlib.
+        assert general == it._ORIG_SELECT(rlist, wlist, [], 1) == (rlist, wlist, [])
+        assert reads_only == it._ORIG_SELECT(rlist, [], [], 1) == (rlist, [], [])
+        assert w_mixed == it._ORIG_SELECT([], mixed, [], 1) == ([], mixed, [])
+        # Only a is readable: both of its aliases come back, around the skipped b.
+        assert r_mixed == it._ORIG_SELECT(mixed, [], [], 1)
+        assert r_mixed == ([mixed[0], a], [], [])
+    finally:
+        a.close()
+        b.close()
+
+
+def test_select_rejects_non_fd_with_type_error(patched):
+    import select
+
+    def fn(res):
+        select.select([object()], [], [], 0)
+
+    t, res = run_worker(fn)
+    assert res.done.wait(2)
+    t.join(2)
+    assert type(res.exc) is TypeError
+
+
+@pytest.mark.skipif(not hasattr(os, "eventfd"), reason="needs os.eventfd (Linux)")
+def test_select_wakeup_uses_single_eventfd(patched):
+    import select
+
+    r, w = os.pipe()
+    try:
+
+        def fn(res):
+            st = it._tls.state
+            res.st = st
+            select.select([r], [], [])
+
+        t, res = run_worker(fn)
+        _REAL_SLEEP(0.05)
+        assert res.st.rfd != -1
+        assert res.st.rfd == res.st.wfd
+        t.interrupt()
+        assert res.done.wait(2)
+        assert isinstance(res.exc, ThreadInterrupted)
+        t.join(2)
+        assert res.st.rfd == res.st.wfd == -1
+    finally:
+        os.close(r)
+        os.close(w)
+
+
+def test_repeated_interrupts_write_one_wakeup(patched):
+    ready = threading.Event()
+    release = threading.Event()
+
+    def fn(res):
+        res.st = it._tls.state
+        res.st.ensure_pipe()
+        with critical_section():
+            ready.set()
+            release.wait()
+
+    t, res = run_worker(fn)
+    try:
+        assert ready.wait(2)
+        for _ in range(5):
+            t.interrupt()
+        st = res.st
+        with st.cancel_cond:
+            assert st.wakeup_pending is True
+            if hasattr(os, "eventfd"):
+                assert os.eventfd_read(st.rfd) == 1
+            else:
+                assert os.read(st.rfd, 64) == b"\x00"
+    finally:
+        # Never leave the worker parked in critical_section() on a failed assert.
+        release.set()
+    assert res.done.wait(2)
+    assert isinstance(res.exc, ThreadInterrupted)
+
+
+def test_selector_registers_wakeup_lazily(patched):
+    import selectors
+
+    def fn(res):
+        st = it._tls.state
+        with selectors.DefaultSelector() as sel:
+            res.fd_before_select = st.rfd
+            res.keys_before_select = len(sel.get_map())
+            sel.select(100)
+
+    t, res = run_worker(fn)
+    _REAL_SLEEP(0.05)
+    t.interrupt()
+    assert res.done.wait(2)
+    assert isinstance(res.exc, ThreadInterrupted)
+    assert res.fd_before_select == -1
+    assert res.keys_before_select == 0
+
+
 def test_asyncio_clean_cancellation(patched):
     def fn(res):
         import asyncio
@@ -297,6 +479,70 @@ def test_recursive_interrupt(patched):
         assert isinstance(kr.exc, ThreadInterrupted)
 
 
+def test_recursive_interrupt_reaches_grandchildren(patched):
+    depth = 4
+    results: list[Result] = []
+    ready = threading.Event()
+
+    def make_level(level):
+        def fn(res):
+            if level < depth:
+                kr = Result()
+                results.append(kr)
+                kt = InterruptibleThread(
+                    target=capturing(make_level(level + 1), kr), daemon=True
+                )
+                kt.start()
+                kr.started.wait(2)
+            else:
+                ready.set()
+            time.sleep(100)
+
+        return fn
+
+    t, res = run_worker(make_level(1))
+    assert ready.wait(3)
+    _REAL_SLEEP(0.05)
+    t.interrupt(recursive=True)
+    assert res.done.wait(3)
+    assert isinstance(res.exc, ThreadInterrupted)
+    assert len(results) == depth - 1
+    for kr in results:
+        assert kr.done.wait(2)
+        assert isinstance(kr.exc, ThreadInterrupted)
+
+
+@needs_async_injection
+@pytest.mark.parametrize("busy_root", [False, True])
+def test_recursive_interrupt_injects_busy_children(patched, busy_root):
+    # Busy threads can only be reached by the deferred (second-pass) injection.
+    kres = [Result() for _ in range(3)]
+
+    def busy(res):
+        while True:
+            pass
+
+    def parent_fn(res):
+        for kr in kres:
+            InterruptibleThread(target=capturing(busy, kr), daemon=True).start()
+            kr.started.wait(2)
+        if busy_root:
+            while True:
+                pass
+        time.sleep(100)
+
+    t, res = run_worker(parent_fn)
+    for kr in kres:
+        assert kr.started.wait(3)
+    _REAL_SLEEP(0.05)
+    t.interrupt(recursive=True)
+    assert res.done.wait(3)
+    assert isinstance(res.exc, ThreadInterrupted)
+    for kr in kres:
+        assert kr.done.wait(2)
+        assert isinstance(kr.exc, ThreadInterrupted)
+
+
 def test_child_removed_from_parent_after_exit(patched):
     release = threading.Event()
 
@@ -320,16 +566,48 @@ def test_child_removed_from_parent_after_exit(patched):
     while not getattr(res, "child_done", False):
         _REAL_SLEEP(0.01)
     _REAL_SLEEP(0.05)
-    parent_st = it._State.get_state_by_ident(t.ident)
+    parent_st = it._State.registry.get(t.ident)
     assert parent_st is not None
     with parent_st.cancel_cond:
         assert res.child_tid not in parent_st.children
     # The exited child is fully unregistered.
-    assert it._State.get_state_by_ident(res.child_tid) is None
+    assert it._State.registry.get(res.child_tid) is None
     release.set()
     t.join(2)
 
 
+def test_unreferenced_state_dropped_from_registry_and_fds_closed(patched):
+    import gc
+
+    # A state whose explicit unregistration was missed: entered in the registry
+    # under a key no live thread has, with nothing else referencing it.
+    fake_tid = -12345
+
+    def fn(res):
+        st = it._State()
+        st.ensure_pipe()
+        res.fds = {st.rfd, st.wfd}
+        it._State.registry[fake_tid] = st
+        assert it._State.registry.get(fake_tid) is st
+        del st
+        gc.collect()
+        res.registered = it._State.registry.get(fake_tid)
+        res.open_fds = []
+        for fd in res.fds:
+            try:
+                os.fstat(fd)
+            except OSError:
+                continue
+            res.open_fds.append(fd)
+
+    t, res = run_worker(fn)
+    assert res.done.wait(2)
+    t.join(2)
+    assert res.exc is None
+    assert res.registered is None
+    assert res.open_fds == []
+
+
 def test_masking_defers_until_exit(patched):
     in_mask = threading.Event()
 
@@ -527,6 +805,60 @@ def test_legacy_keyboardinterrupt_mode():
         InterruptibleThread.uninstall_patches()
 
 
+@needs_async_injection
+def test_nudge_signal_breaks_non_retrying_c_call():
+    import ctypes
+    import signal
+
+    # libc pause() via ctypes returns on EINTR instead of auto-retrying (PEP 475
+    # only covers the stdlib wrappers), so the nudge lets the async exc fire.
+    libc = ctypes.CDLL(None)
+    prev = signal.getsignal(signal.SIGUSR1)
+    InterruptibleThread.install_patches(nudge_signal=signal.SIGUSR1)
+    try:
+
+        def fn(res):
+            while True:
+                libc.pause()
+
+        t, res = run_worker(fn)
+        _REAL_SLEEP(0.05)
+        t.interrupt()
+        assert res.done.wait(2), "pause() was not interrupted"
+        assert isinstance(res.exc, ThreadInterrupted)
+        t.join(2)
+    finally:
+        InterruptibleThread.uninstall_patches()
+    assert signal.getsignal(signal.SIGUSR1) == prev
+
+
+def test_uninstall_with_nudge_signal_off_main_thread_changes_nothing():
+    import signal
+
+    prev = signal.getsignal(signal.SIGUSR1)
+    InterruptibleThread.install_patches(nudge_signal=signal.SIGUSR1)
+    try:
+        errors: list[BaseException] = []
+
+        def off_main():
+            try:
+                InterruptibleThread.uninstall_patches()
+            except ValueError as e:
+                errors.append(e)
+
+        th = it._ORIG_THREAD(target=off_main)
+        th.start()
+        th.join(2)
+        assert len(errors) == 1
+        # Nothing was half-undone: still fully installed, so a retry works.
+        assert time.sleep is it._coop_sleep
+        assert signal.getsignal(signal.SIGUSR1) is it._noop_signal_handler
+    finally:
+        InterruptibleThread.uninstall_patches()
+    assert time.sleep is it._ORIG_SLEEP
+    assert signal.getsignal(signal.SIGUSR1) == prev
+
+
 def test_interrupt_finished_thread_raises_value_error(patched):
     def fn(res):
         return 42
@@ -544,6 +876,39 @@ def test_main_thread_checkpoint_is_noop(patched):
     assert is_interrupted() is False
 
 
+def test_plain_thread_bypasses_patched_primitives(patched):
+    out = {}
+
+    def fn():
+        time.sleep(0.01)
+        out["state"] = it._tls.state
+        out["registered"] = it._State.registry.get(threading.get_ident())
+
+    t = it._ORIG_THREAD(target=fn, daemon=True)
+    t.start()
+    t.join(2)
+    assert out == {"state": None, "registered": None}
+
+
+def test_threading_thread_resolves_per_thread(patched):
+    out = {}
+
+    def plain():
+        out["plain"] = threading.Thread
+
+    def fn(res):
+        out["interruptible"] = threading.Thread
+        pt = it._ORIG_THREAD(target=plain)
+        pt.start()
+        pt.join(2)
+
+    t, res = run_worker(fn)
+    assert res.done.wait(2)
+    t.join(2)
+    assert threading.Thread is it._ORIG_THREAD
+    assert out == {"interruptible": InterruptibleThread, "plain": it._ORIG_THREAD}
+
+
 def test_patch_round_trip():
     assert threading.Thread is it._ORIG_THREAD
     InterruptibleThread.install_patches()